@@ -2,77 +2,199 @@ import pandas as pd
 import numpy as np
 import re
 import json
-from collections import defaultdict
+import asyncio
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+import aiohttp
+from aiolimiter import AsyncLimiter
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
+import orjson
 import time
 
+# Shared session so every sync call reuses pooled keep-alive connections to
+# redfin.ca instead of paying a fresh TCP+TLS handshake per request
+_ADAPTER = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+_SESSION = requests.Session()
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.mount('http://', _ADAPTER)
+# Ask for compressed bodies (requests decompresses transparently); the
+# viewport pages are hundreds of KB uncompressed
+_SESSION.headers['Accept-Encoding'] = 'gzip, br'
+
+# On-disk copy of the Vancouver city-boundary extents; the boundary is
+# effectively static, so refetching it every run is pure waste
+_BOUNDARY_CACHE_PATH = Path.home() / '.cache' / 'redfin_etl' / 'van_boundary.json'
+_BOUNDARY_CACHE_TTL = 30 * 24 * 3600  # 30 days, in seconds
+
+# Precompiled pattern for the two counts in the listing summary, plus a
+# translation table that strips thousands separators faster than str.replace
+_COUNT_RE = re.compile(r'\d[\d,]*')
+_COMMA_TBL = str.maketrans('', '', ',')
+
+# Column layouts for the three accumulator tables; metrics_extraction appends
+# one tuple per record and the batch extractors build the DataFrames once at
+# the end of the crawl
+RESULT_COLS = ('address', 'postalCode', 'latitude', 'longitude', 'price', 'square_footage', 'bedroom', 'url')
+RESULT_EVENT_COLS = ('address', 'postalCode', 'latitude', 'longitude', 'price', 'url')
+RESULT_EVENT_LIST_COLS = ('address', 'postalCode', 'latitude', 'longitude', 'url')
+
+# Selectors compiled to XPath once at import; Element.cssselect would
+# re-translate the expression on every page
+_SEL_NO_LISTING = CSSSelector('div.HomeViews.reversePosition h2')
+_SEL_SUMMARY = CSSSelector('div.homes.summary.reversePosition')
+
+# JSON-LD payload query compiled once; smart_strings=False makes it return
+# plain str instead of lxml's str subclass, which orjson refuses to decode
+_JSONLD_XPATH = etree.XPath('//script[@type="application/ld+json"]/text()',
+                            smart_strings=False)
+
+# Rate limiting: the async path uses a token bucket that accounts for
+# request duration; the sync path sleeps only the remainder of the interval
+_MAX_REQUESTS_PER_SEC = 5  # burst ceiling for the async token bucket
+_MIN_REQUEST_INTERVAL = 1.0  # seconds between sync requests
+_next_request_at = 0.0
+_RATE_LIMITERS = weakref.WeakKeyDictionary()  # one AsyncLimiter per event loop
+
+
+def _rate_limiter():
+    """
+    Returns the token-bucket limiter bound to the running event loop.
+
+    aiolimiter instances must not be shared across loops, so each loop gets
+    its own bucket on first use; the weak keys let finished loops drop out.
+    """
+
+    loop = asyncio.get_running_loop()
+    limiter = _RATE_LIMITERS.get(loop)
+    if limiter is None:
+        limiter = _RATE_LIMITERS[loop] = AsyncLimiter(_MAX_REQUESTS_PER_SEC, 1.0)
+    return limiter
+
+
+def _throttle():
+    """
+    Enforces the minimum interval between sync requests.
+
+    Sleeps only for whatever remains of the interval since the previous
+    request, so time already spent waiting on the response counts toward
+    the delay.
+    """
+
+    global _next_request_at
+    now = time.monotonic()
+    if now < _next_request_at:
+        time.sleep(_next_request_at - now)
+    _next_request_at = max(now, _next_request_at) + _MIN_REQUEST_INTERVAL
+
 def split_coordinate(four_coords, divisions_longs, devision_lats, if_big_box):
-    
+
     if if_big_box:
         [min_latitude, max_latitude, min_longitude, max_longitude] = [float(x) for x in if_big_box.split(':')]
     else:
          [min_latitude, max_latitude, min_longitude, max_longitude] = four_coords
 
-    longitude_step = (max_longitude - min_longitude) / divisions_longs
-    latitude_step = (max_latitude - min_latitude) / devision_lats  # Typo: should be "divisions_lats"
+    # Compute every grid edge in one vectorized pass instead of per-cell
+    # Python arithmetic; linspace yields the same division points as the old
+    # min + k * step loop
+    lat_edges = np.round(np.linspace(min_latitude, max_latitude, devision_lats + 1), 5)
+    lon_edges = np.round(np.linspace(min_longitude, max_longitude, divisions_longs + 1), 5)
+
+    # Store each bounding box as "min_lat:max_lat:min_lon:max_lon", keeping
+    # the original ordering (longitude-major, latitude-minor)
+    coord_boxes = [
+        f"{lat_edges[j]}:{lat_edges[j + 1]}:{lon_edges[i]}:{lon_edges[i + 1]}"
+        for i in range(divisions_longs)
+        for j in range(devision_lats)
+    ]
 
-    coord_boxes = []
-    
-    # Generate bounding boxes for each grid cell
-    for i in range(divisions_longs):
-        for j in range(devision_lats):
-            box_min_lat = round(min_latitude + j * latitude_step, 5)
-            box_max_lat = round(min_latitude + (j + 1) * latitude_step, 5)
-            box_min_lon = round(min_longitude + i * longitude_step, 5)
-            box_max_lon = round(min_longitude + (i + 1) * longitude_step, 5)
-
-            # Store bounding box as a string in the format "min_lat:max_lat:min_lon:max_lon"
-            box_str = f"{box_min_lat}:{box_max_lat}:{box_min_lon}:{box_max_lon}"
-            coord_boxes.append(box_str)
-    
     return coord_boxes
 
 
-def vancouver_grid(head, divisions_longs, devision_lats):
+@lru_cache(maxsize=1)
+def _fetch_boundary(head_items):
     """
-    Generates a grid of latitude-longitude bounding boxes within Vancouver's city boundary.
+    Fetches Vancouver's city-boundary extents, caching in memory and on disk.
 
     Parameters:
-    head (dict): Headers for the API request.
-    divisions_longs (int): Number of divisions along the longitude (default is 15).
-    devision_lats (int): Number of divisions along the latitude (default is 15).
+    head_items (tuple): Request headers as sorted (key, value) pairs so the
+        lru_cache key is hashable.
 
     Returns:
-    list: A list of strings representing bounding boxes in the format "min_lat:max_lat:min_lon:max_lon".
+    tuple: (min_latitude, max_latitude, min_longitude, max_longitude).
     """
-    
+
+    # Serve from the on-disk copy while it is younger than the TTL
+    if _BOUNDARY_CACHE_PATH.exists():
+        if time.time() - _BOUNDARY_CACHE_PATH.stat().st_mtime < _BOUNDARY_CACHE_TTL:
+            return tuple(json.loads(_BOUNDARY_CACHE_PATH.read_text()))
+
     # API endpoint for Vancouver city boundary geo-coordinates
     van_geo_info_url = 'https://opendata.vancouver.ca/api/explore/v2.1/catalog/datasets/city-boundary/records?limit=20'
-    
+
     # Fetch geographical data from the API
-    response = requests.get(van_geo_info_url, headers=head)
+    response = _SESSION.get(van_geo_info_url, headers=dict(head_items))
     geo_data = response.json()
-    
+
     # Extract the city boundary coordinates
     contour = geo_data['results'][0]['geom']['geometry']['coordinates']
 
-    # Flatten the list of coordinates and extract longitude and latitude values separately
-    longitudes = [coord[0] for sublist in contour for coord in sublist]
-    latitudes = [coord[1] for sublist in contour for coord in sublist]
+    # Stack the boundary rings into one (n, 2) array and take the extents in
+    # a single vectorized pass instead of flattening into two Python lists
+    # and scanning them four times
+    pts = np.concatenate([np.asarray(s, dtype=np.float64) for s in contour], axis=0)
+    (min_longitude, min_latitude), (max_longitude, max_latitude) = pts.min(0), pts.max(0)
+    four_coords = (min_latitude, max_latitude, min_longitude, max_longitude)
 
-    # Determine the minimum and maximum longitude and latitude values
-    max_longitude = max(longitudes)
-    min_longitude = min(longitudes)
-    max_latitude = max(latitudes)
-    min_latitude = min(latitudes)
-    four_coords = [min_latitude, max_latitude, min_longitude, max_longitude]
+    # Persist the extents for the next run
+    _BOUNDARY_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    _BOUNDARY_CACHE_PATH.write_text(json.dumps(four_coords))
 
-    
-    coord_boxes = split_coordinate(four_coords, divisions_longs, devision_lats, if_big_box = 0)
- 
-    
-    return coord_boxes
+    return four_coords
+
+
+@lru_cache(maxsize=8)
+def _build_grid(four_coords, divisions_longs, devision_lats):
+    """
+    Builds the grid of bounding boxes for a fixed set of boundary extents.
+
+    Parameters:
+    four_coords (tuple): (min_latitude, max_latitude, min_longitude, max_longitude).
+    divisions_longs (int): Number of divisions along the longitude.
+    devision_lats (int): Number of divisions along the latitude.
+
+    Returns:
+    list: A list of strings representing bounding boxes in the format "min_lat:max_lat:min_lon:max_lon".
+    """
+
+    return split_coordinate(list(four_coords), divisions_longs, devision_lats, if_big_box = 0)
+
+
+def vancouver_grid(head, divisions_longs, devision_lats):
+    """
+    Generates a grid of latitude-longitude bounding boxes within Vancouver's city boundary.
+
+    The boundary extents and the grid built from them are static for a given
+    division count, so both halves are cached and repeat calls skip the
+    opendata request entirely.
+
+    Parameters:
+    head (dict): Headers for the API request.
+    divisions_longs (int): Number of divisions along the longitude (default is 15).
+    devision_lats (int): Number of divisions along the latitude (default is 15).
+
+    Returns:
+    list: A list of strings representing bounding boxes in the format "min_lat:max_lat:min_lon:max_lon".
+    """
+
+    four_coords = _fetch_boundary(tuple(sorted(head.items())))
+
+    return _build_grid(four_coords, divisions_longs, devision_lats)
 
 
 def listing_count(head, coord_box):
@@ -95,27 +217,35 @@ def listing_count(head, coord_box):
     viewport_url = f"https://www.redfin.ca/bc/vancouver/filter/viewport={coord_box}"
     
     # Send a GET request to fetch the webpage
-    resp = requests.get(viewport_url, headers=head)
+    resp = _SESSION.get(viewport_url, headers=head)
 
     # Raise an error if the request fails (non-200 status code)
     if resp.status_code != 200:
         raise Exception("Failing in webpage requests")
     
-    # Parse the HTML response using BeautifulSoup
-    soup = BeautifulSoup(resp.text, 'html.parser')
-
-    # Check if the page indicates no listings are available
-    if soup.find('div', {'class': 'HomeViews reversePosition'}).find('h2'):
+    # Parse the raw response bytes straight into an lxml element tree
+    # (bytes input lets lxml handle decoding itself)
+    tree = lxml.html.fromstring(resp.content)
+
+    # Check if the page indicates no listings are available; the single
+    # descendant selector answers in one pass and an absent container simply
+    # yields no matches instead of raising
+    if _SEL_NO_LISTING(tree):
         return 'no_listing'
     
-    # Extract the listing summary section
-    listing_summary = soup.find('div', {'class': "homes summary reversePosition"})
+    # Extract the listing summary section; a page without the summary block
+    # carries no listings either
+    summary_matches = _SEL_SUMMARY(tree)
+    if not summary_matches:
+        return 'no_listing'
+    listing_summary = summary_matches[0]
+
+    # Extract the two numeric values with the precompiled pattern
+    select_listing_count, total_listing_count = _COUNT_RE.findall(listing_summary.text_content())
 
-    # Use regex to extract numeric values from the listing summary
-    select_listing_count, total_listing_count = re.findall(r'\d{1,10}(?:,\d{1,10})*', listing_summary.text)
-    
     # Convert extracted strings into integers, handling comma formatting
-    select_listing_count, total_listing_count = int(select_listing_count), int(total_listing_count.replace(',', ''))
+    select_listing_count = int(select_listing_count.translate(_COMMA_TBL))
+    total_listing_count = int(total_listing_count.translate(_COMMA_TBL))
     
     return viewport_url, select_listing_count, total_listing_count
 
@@ -131,136 +261,179 @@ def crawling_redfin(head, viewport_url, page):
     page (int): Page number to crawl.
 
     Returns:
-    list: A list of BeautifulSoup objects representing individual property listings.
+    lxml.html.HtmlElement: Parsed document tree for the requested page.
     """
     
     # Construct the URL for the specified page number
     target_url = f"{viewport_url}/page-{page}"
     
     # Send a GET request to fetch the webpage
-    resp = requests.get(target_url, headers=head)
+    resp = _SESSION.get(target_url, headers=head)
 
     # Raise an error if the request fails (non-200 status code)
     if resp.status_code != 200:
         raise Exception("Failing in webpage requests")
     
-    # Parse the HTML response using BeautifulSoup
-    soup = BeautifulSoup(resp.text, 'html.parser')
+    # Parse the raw response bytes straight into an lxml element tree
+    # (bytes input lets lxml handle decoding itself)
+    tree = lxml.html.fromstring(resp.content)
+
+    return tree
+
+
+
+def _walk(d, *keys, default=None):
+    """
+    Follows a chain of dictionary keys, returning default on any miss.
+
+    Parameters:
+    d (dict): The dictionary to walk; non-dict values short-circuit to default.
+    *keys: Keys to follow in order.
+    default: Value to return when the chain breaks or ends in None.
+
+    Returns:
+    The value at the end of the chain, or default.
+    """
 
-    return soup
+    for k in keys:
+        d = d.get(k) if isinstance(d, dict) else None
+    return d if d is not None else default
 
 
+def _classify(i):
+    """
+    Classifies one JSON-LD item into a handler key.
+
+    Parameters:
+    i: A decoded JSON-LD payload (dict or list).
+
+    Returns:
+    str or None: 'prop' for property pairs, 'event_list' / 'event_dict' for
+        Events by location shape, None for items with no handler.
+    """
+
+    if isinstance(i, list):
+        return 'prop'
+    if isinstance(i, dict) and i.get('@type') == 'Event':
+        return 'event_list' if isinstance(i.get('location'), list) else 'event_dict'
+    return None
+
+
+def _handle_event_list_loc(j, i, result, result_event, result_event_list, further_invest):
+    # Extract detailed location information from the second venue entry
+    # without raising on absent keys
+    location = i.get('location')
+    venue = location[1] if len(location) > 1 else None
+    address = _walk(venue, 'address', 'streetAddress')
+    postalCode = _walk(venue, 'address', 'postalCode')
+    latitude = _walk(venue, 'geo', 'latitude')
+    longitude = _walk(venue, 'geo', 'longitude')
+    url = i.get('url')
+
+    # Collect items with missing critical fields; complete records become
+    # one RESULT_EVENT_LIST_COLS row
+    if None in (address, postalCode, latitude, longitude):
+        further_invest.append((j, i))
+    else:
+        result_event_list.append((address, postalCode, latitude, longitude, url))
+
+
+def _handle_event_dict_loc(j, i, result, result_event, result_event_list, further_invest):
+    # Extract location and event details without raising on absent keys
+    location = i.get('location')
+    address = _walk(location, 'name')
+    postalCode = _walk(location, 'address', 'postalCode')
+    latitude = _walk(location, 'geo', 'latitude')
+    longitude = _walk(location, 'geo', 'longitude')
+    price = _walk(i, 'offers', 'price')
+    url = i.get('url')
+
+    # Collect items with missing critical fields; complete records become
+    # one RESULT_EVENT_COLS row
+    if location is None or None in (postalCode, latitude, longitude, price):
+        further_invest.append(i)
+    else:
+        result_event.append((address, postalCode, latitude, longitude, price, url))
+
+
+def _handle_property_pair(j, i, result, result_event, result_event_list, further_invest):
+    # Extract property details from the first item and the price from the
+    # second, without raising on absent keys
+    i_1 = i[0] if i else None
+    i_2 = i[1] if len(i) > 1 else None
+    address = _walk(i_1, 'address', 'streetAddress')
+    postalCode = _walk(i_1, 'address', 'postalCode')
+    latitude = _walk(i_1, 'geo', 'latitude')
+    longitude = _walk(i_1, 'geo', 'longitude')
+    sqr_footage = _walk(i_1, 'floorSize', 'value')
+    bedrooms = _walk(i_1, 'numberOfRooms')
+    url = _walk(i_1, 'url')
+    price = _walk(i_2, 'offers', 'price')
+
+    # Collect items with missing critical fields; complete records become
+    # one RESULT_COLS row
+    if None in (address, postalCode, latitude, longitude, sqr_footage, price):
+        further_invest.append((j, i))
+    else:
+        result.append((address, postalCode, latitude, longitude, price, sqr_footage, bedrooms, url))
+
+
+# One hash lookup replaces the per-item isinstance / @type branch chain;
+# unhandled kinds (Organization, BreadcrumbList, ...) classify to None
+_HANDLERS = {
+    'event_list': _handle_event_list_loc,
+    'event_dict': _handle_event_dict_loc,
+    'prop': _handle_property_pair,
+}
 
-def metrics_extraction(result, result_event, result_event_list, further_invest, soup):
+
+def metrics_extraction(result, result_event, result_event_list, further_invest, tree):
     """
     Extract structured metadata from web pages using JSON-LD script tags.
 
-    This function parses JSON-LD script tags in a BeautifulSoup object to extract 
-    structured information about events, properties, and other entities.
+    This function pulls the JSON-LD script payloads out of an lxml document
+    with a single XPath query, decodes them with orjson, and routes each item
+    through the _HANDLERS dispatch table to extract structured information
+    about events, properties, and other entities.
 
     Args:
-        result (dict): Dictionary to store extracted property information.
-        result_event (dict): Dictionary to store extracted event information.
-        result_event_list (dict): Dictionary to store alternative event information.
+        result (list): Rows of property information, one RESULT_COLS tuple each.
+        result_event (list): Rows of event information, one RESULT_EVENT_COLS tuple each.
+        result_event_list (list): Rows of alternative event information, one
+            RESULT_EVENT_LIST_COLS tuple each.
         further_invest (list): List to collect items that couldn't be fully processed.
-        soup (BeautifulSoup): Parsed HTML document to extract metadata from.
+        tree (lxml.html.HtmlElement): Parsed HTML document to extract metadata from.
 
     Returns:
-        None: Modifies input dictionaries and list in-place.
+        None: Modifies the input lists in-place.
     """
-    # Find all JSON-LD script tags and parse their contents
-    info = soup.find_all('script', {'type':'application/ld+json'})
-    info = [json.loads(i.string) for i in info]
+    # Grab every JSON-LD payload in one XPath pass and decode with orjson
+    raw = _JSONLD_XPATH(tree)
+    info = [orjson.loads(s) for s in raw]
 
-    # Iterate through each parsed JSON-LD item
+    # Dispatch each parsed JSON-LD item to its handler
     for j, i in enumerate(info):
-        # Process dictionary-type items
-        if isinstance(i, dict):
-            # Get the type of the current item
-            type_i = i.get('@type')
-            
-            # Skip Organization and BreadcrumbList types
-            if type_i in ['Organization', 'BreadcrumbList']:
-                continue
-            
-            # Process Event type items
-            elif type_i == 'Event':
-                # Handle location information
-                location = i.get('location')
-            
-                # Process list-type location
-                if isinstance(location, list):
-                    try:
-                        # Extract detailed location information
-                        address = location[1].get('address').get('streetAddress')
-                        postalCode = location[1].get('address').get('postalCode')
-                        latitude = location[1].get('geo').get('latitude')
-                        longitude = location[1].get('geo').get('longitude')
-                        url = i.get('url')
-
-                        # Store extracted information in result_event_list
-                        result_event_list['address'].append(address)
-                        result_event_list['postalCode'].append(postalCode)
-                        result_event_list['latitude'].append(latitude)
-                        result_event_list['longitude'].append(longitude)
-                        result_event_list['url'].append(url)
-                    except:
-                        # Collect items that couldn't be processed
-                        further_invest.append((j, i))
-                
-                # Process dictionary-type location
-                else:
-                    try:
-                        # Extract location and event details
-                        address = location.get('name')
-                        postalCode = location.get('address').get('postalCode') 
-                        latitude = location.get('geo').get('latitude')
-                        longitude = location.get('geo').get('longitude')
-                        price = i.get('offers').get('price')
-                        url = i.get('url')
-                        
-                        # Store extracted information in result_event
-                        result_event['address'].append(address)
-                        result_event['postalCode'].append(postalCode)
-                        result_event['latitude'].append(latitude)
-                        result_event['longitude'].append(longitude)
-                        result_event['price'].append(price)
-                        result_event['url'].append(url)
-                
-                    except:
-                        # Collect items that couldn't be processed
-                        further_invest.append(i)
-
-        # Process list-type items (likely property information)
-        elif isinstance(i, list):
-            try: 
-                # Extract property details from first item in the list
-                i_1 = i[0]
-                address = i_1.get('address').get('streetAddress')
-                postalCode = i_1.get('address').get('postalCode')
-                latitude = i_1.get('geo').get('latitude')
-                longitude = i_1.get('geo').get('longitude')
-                sqr_footage = i_1.get('floorSize').get('value')
-                bedrooms = i_1.get('numberOfRooms')
-                url = i_1.get('url')
-                
-                # Extract price from second item in the list
-                i_2 = i[1]
-                price = i_2.get('offers').get('price')
-
-                # Store extracted property information
-                result['address'].append(address)
-                result['postalCode'].append(postalCode)
-                result['latitude'].append(latitude)
-                result['longitude'].append(longitude)
-                result['price'].append(price)
-                result['square_footage'].append(sqr_footage)
-                result['bedroom'].append(bedrooms)
-                result['url'].append(url)
-            
-            except:
-                # Collect items that couldn't be processed
-                further_invest.append((j,i))
+        handler = _HANDLERS.get(_classify(i))
+        if handler:
+            handler(j, i, result, result_event, result_event_list, further_invest)
+
+
+def _chunked(seq, n):
+    """
+    Splits a sequence into n contiguous chunks of near-equal size.
+
+    Parameters:
+    seq (list): The sequence to split.
+    n (int): Number of chunks.
+
+    Returns:
+    list: n slices of seq; the first len(seq) % n chunks are one longer.
+    """
+
+    # Same balanced split as np.array_split, but the chunks stay plain list
+    # slices instead of object arrays that box every string
+    k, m = divmod(len(seq), n)
+    return [seq[i * k + min(i, m):(i + 1) * k + min(i + 1, m)] for i in range(n)]
 
 
 def calculate_min_pages(total_count, items_per_page):
@@ -296,17 +469,18 @@ def extracting_by_batch_method2(head, batch_num, divisions_longs=15, divisions_l
 
     Returns:
         tuple: A tuple containing:
-            - result (dict): Main property listing information
-            - result_event (dict): Event-related listing information
-            - result_event_list (dict): Alternative event listing information
+            - result (pd.DataFrame): Main property listing information
+            - result_event (pd.DataFrame): Event-related listing information
+            - result_event_list (pd.DataFrame): Alternative event listing information
             - big_coord_boxes (list): Coordinate boxes with more than one page of listings
             - url_with_issue (list): URLs that encountered issues during extraction
     """
-    # Initialize data containers
+    # Initialize data containers; rows accumulate as tuples and become
+    # DataFrames only once, at the end of the crawl
     big_coord_boxes = []  
-    result_event = defaultdict(list)
-    result_event_list = defaultdict(list)
-    result = defaultdict(list)
+    result_event = []
+    result_event_list = []
+    result = []
     url_with_issue = []
 
     # Determine coordinate boxes
@@ -318,7 +492,7 @@ def extracting_by_batch_method2(head, batch_num, divisions_longs=15, divisions_l
         coord_boxes = vancouver_grid(head, divisions_longs, divisions_lats)
     
     # Split coordinate boxes into batches
-    coord_box_batch = np.array_split(coord_boxes, batch_num)
+    coord_box_batch = _chunked(coord_boxes, batch_num)
     
     # Process each batch of coordinate boxes
     for i in range(len(coord_box_batch)):
@@ -326,9 +500,10 @@ def extracting_by_batch_method2(head, batch_num, divisions_longs=15, divisions_l
         
         # Process each coordinate box in the current batch
         for coord_box in batch:
-            # Check the number of listings in the current coordinate box
+            # Check the number of listings in the current coordinate box,
+            # pacing requests without paying a fixed delay on slow responses
             listing_info = listing_count(head, coord_box)
-            time.sleep(1)  # Add a small delay to prevent overwhelming the server
+            _throttle()
             
             # Skip if no listings are found
             if listing_info == 'no_listing':
@@ -350,10 +525,10 @@ def extracting_by_batch_method2(head, batch_num, divisions_longs=15, divisions_l
                     # Assumes 9 listings per page
                     max_page = calculate_min_pages(select_listing_count, items_per_page=9)
                     
-                    # Crawl each page of listings
-                    for page in range(1, max_page):
+                    # Crawl each page of listings (inclusive of the last)
+                    for page in range(1, max_page + 1):
                         # Fetch the page content
-                        soup = crawling_redfin(head, viewport_url, page)
+                        tree = crawling_redfin(head, viewport_url, page)
                         
                         # Extract metrics from the page
                         metrics_extraction(
@@ -361,8 +536,309 @@ def extracting_by_batch_method2(head, batch_num, divisions_longs=15, divisions_l
                             result_event, 
                             result_event_list, 
                             url_with_issue, 
-                            soup
+                            tree
                         )
     
-    # Return extracted information
-    return result, result_event, result_event_list, big_coord_boxes, url_with_issue
\ No newline at end of file
+    # Build the output tables in one shot from the accumulated rows
+    return (
+        pd.DataFrame(result, columns=list(RESULT_COLS)),
+        pd.DataFrame(result_event, columns=list(RESULT_EVENT_COLS)),
+        pd.DataFrame(result_event_list, columns=list(RESULT_EVENT_LIST_COLS)),
+        big_coord_boxes,
+        url_with_issue,
+    )
+
+
+async def _fetch_async(session, url, semaphore):
+    """
+    Fetches a URL with aiohttp, bounded by a shared semaphore.
+
+    Parameters:
+    session (aiohttp.ClientSession): Shared HTTP session for connection reuse.
+    url (str): The URL to fetch.
+    semaphore (asyncio.Semaphore): Limits the number of in-flight requests.
+
+    Returns:
+    bytes: The raw response body.
+    """
+
+    async with semaphore:
+        # The token bucket counts the request itself toward the rate, so a
+        # slow response never pays an extra fixed delay on top
+        async with _rate_limiter():
+            async with session.get(url) as resp:
+                # Raise an error if the request fails (non-200 status code)
+                if resp.status != 200:
+                    raise Exception("Failing in webpage requests")
+
+                body = await resp.read()
+
+    return body
+
+
+async def listing_count_async(session, coord_box, semaphore):
+    """
+    Async counterpart of listing_count using a shared aiohttp session.
+
+    Parameters:
+    session (aiohttp.ClientSession): Shared HTTP session for connection reuse.
+    coord_box (str): A string representing the bounding box in the format "min_lat:max_lat:min_lon:max_lon".
+    semaphore (asyncio.Semaphore): Limits the number of in-flight requests.
+
+    Returns:
+    tuple: (viewport_url, select_listing_count, total_listing_count), or
+        'no_listing' if no listings are found.
+    """
+
+    # Construct the URL for the given coordinate box
+    viewport_url = f"https://www.redfin.ca/bc/vancouver/filter/viewport={coord_box}"
+
+    body = await _fetch_async(session, viewport_url, semaphore)
+
+    # Parse off the event loop so CPU-bound parsing doesn't stall other fetches
+    tree = await asyncio.to_thread(lxml.html.fromstring, body)
+
+    # Check if the page indicates no listings are available; the single
+    # descendant selector answers in one pass and an absent container simply
+    # yields no matches instead of raising
+    if _SEL_NO_LISTING(tree):
+        return 'no_listing'
+
+    # Extract the listing summary section; a page without the summary block
+    # carries no listings either
+    summary_matches = _SEL_SUMMARY(tree)
+    if not summary_matches:
+        return 'no_listing'
+    listing_summary = summary_matches[0]
+
+    # Extract the two numeric values with the precompiled pattern
+    select_listing_count, total_listing_count = _COUNT_RE.findall(listing_summary.text_content())
+
+    # Convert extracted strings into integers, handling comma formatting
+    select_listing_count = int(select_listing_count.translate(_COMMA_TBL))
+    total_listing_count = int(total_listing_count.translate(_COMMA_TBL))
+
+    return viewport_url, select_listing_count, total_listing_count
+
+
+async def crawling_redfin_async(session, viewport_url, page, semaphore):
+    """
+    Async counterpart of crawling_redfin using a shared aiohttp session.
+
+    Parameters:
+    session (aiohttp.ClientSession): Shared HTTP session for connection reuse.
+    viewport_url (str): Base URL for the listings search.
+    page (int): Page number to crawl.
+    semaphore (asyncio.Semaphore): Limits the number of in-flight requests.
+
+    Returns:
+    lxml.html.HtmlElement: Parsed document tree for the requested page.
+    """
+
+    # Construct the URL for the specified page number
+    target_url = f"{viewport_url}/page-{page}"
+
+    body = await _fetch_async(session, target_url, semaphore)
+
+    # Parse off the event loop so CPU-bound parsing doesn't stall other fetches
+    tree = await asyncio.to_thread(lxml.html.fromstring, body)
+
+    return tree
+
+
+def parse_and_extract(body):
+    """
+    Parses one page body and extracts its metrics into fresh containers.
+
+    Top-level (picklable) so it can run in a ProcessPoolExecutor worker,
+    keeping the lxml + orjson work off the event-loop process entirely.
+
+    Parameters:
+    body (bytes): Raw HTML of one listings page.
+
+    Returns:
+    tuple: (result, result_event, result_event_list, further_invest) lists
+        for this single page, ready to merge into the crawl-wide containers.
+    """
+
+    result = []
+    result_event = []
+    result_event_list = []
+    further_invest = []
+
+    tree = lxml.html.fromstring(body)
+    metrics_extraction(result, result_event, result_event_list, further_invest, tree)
+
+    return result, result_event, result_event_list, further_invest
+
+
+async def extracting_by_batch_method2_async(head, batch_num, divisions_longs=15,
+                                            divisions_lats=15, splitted_big_box=0,
+                                            max_concurrency=12, parse_workers=4):
+    """
+    Async version of extracting_by_batch_method2 using aiohttp for concurrent fetches.
+
+    The crawl is >95% network-bound, so overlapping the per-cell requests with
+    asyncio.gather under a bounded semaphore cuts wall time roughly in
+    proportion to the concurrency limit. Fetched bodies flow through an
+    asyncio.Queue to consumer tasks that parse in a ProcessPoolExecutor, so
+    CPU-bound extraction overlaps with the network instead of stalling it.
+
+    Args:
+        head (dict): Headers for web requests.
+        batch_num (int): Number of batches to split the coordinate boxes into.
+        divisions_longs (int, optional): Number of divisions along longitude. Defaults to 15.
+        divisions_lats (int, optional): Number of divisions along latitude. Defaults to 15.
+        splitted_big_box (list, optional): Pre-defined coordinate boxes. Defaults to 0.
+        max_concurrency (int, optional): Maximum number of in-flight requests. Defaults to 12.
+        parse_workers (int, optional): Number of parser processes. Defaults to 4.
+
+    Returns:
+        tuple: Same five outputs as extracting_by_batch_method2.
+    """
+    # Initialize data containers; rows accumulate as tuples and become
+    # DataFrames only once, at the end of the crawl
+    big_coord_boxes = []
+    result_event = []
+    result_event_list = []
+    result = []
+    url_with_issue = []
+
+    # Determine coordinate boxes
+    if splitted_big_box:
+        # Use pre-defined coordinate boxes if provided
+        coord_boxes = splitted_big_box
+    else:
+        # Generate coordinate boxes using vancouver_grid function
+        coord_boxes = vancouver_grid(head, divisions_longs, divisions_lats)
+
+    # Split coordinate boxes into batches
+    coord_box_batch = _chunked(coord_boxes, batch_num)
+
+    # Shared limit on in-flight requests across every coordinate box
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    # Pipeline plumbing: producers push fetched page bodies onto the queue,
+    # consumers hand them to parser processes and merge the results
+    queue = asyncio.Queue()
+    pool = ProcessPoolExecutor(parse_workers)
+    loop = asyncio.get_running_loop()
+
+    # Parsed pages land in preallocated slots, one list per batch, so the
+    # final merge runs in deterministic task order
+    parsed_batches = []
+
+    async def fetch_page(session, sink, idx, viewport_url, page):
+        # Fetch one listings page and enqueue its body for the parsers,
+        # tagged with the slot it should fill
+        body = await _fetch_async(session, f"{viewport_url}/page-{page}", semaphore)
+        queue.put_nowait((sink, idx, body))
+
+    async def consume():
+        # Drain page bodies forever; the tasks are cancelled once the crawl
+        # is done and the queue has been joined
+        while True:
+            sink, idx, body = await queue.get()
+
+            # Parse in a worker process so the event loop keeps fetching,
+            # then fill the page's slot. A parse failure lands in the slot
+            # instead of killing the consumer, and task_done always runs so
+            # queue.join can never block forever
+            try:
+                sink[idx] = await loop.run_in_executor(pool, parse_and_extract, body)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                sink[idx] = exc
+            finally:
+                queue.task_done()
+
+    async def count_box(session, i, coord_box):
+        # Check the number of listings in the current coordinate box
+        listing_info = await listing_count_async(session, coord_box, semaphore)
+
+        # Skip if no listings are found
+        if listing_info == 'no_listing':
+            print(f"Batch {i}-{coord_box} has no listings.")
+            return None
+
+        # Unpack listing information
+        viewport_url, select_listing_count, total_listing_count = listing_info
+
+        # If the number of selected listings doesn't match total listings
+        # mark the coordinate box for further investigation
+        if select_listing_count != total_listing_count:
+            big_coord_boxes.append(coord_box)
+            return None
+
+        # Calculate the number of pages to crawl
+        # Assumes 9 listings per page
+        return viewport_url, calculate_min_pages(select_listing_count, items_per_page=9)
+
+    consumers = [asyncio.create_task(consume()) for _ in range(parse_workers)]
+
+    try:
+        # One session for the whole crawl so connections are pooled and reused
+        async with aiohttp.ClientSession(headers=head) as session:
+            # Process each batch of coordinate boxes
+            for i in range(len(coord_box_batch)):
+                batch = coord_box_batch[i]
+
+                # Phase 1: run every listing_count in the batch concurrently
+                counts = await asyncio.gather(
+                    *(count_box(session, i, coord_box) for coord_box in batch)
+                )
+
+                # Flatten the surviving cells into one (viewport_url, page)
+                # task list (inclusive of the last page) so pages of
+                # different cells overlap freely
+                tasks = []
+                for info in counts:
+                    if info is None:
+                        continue
+                    viewport_url, max_page = info
+                    tasks.extend((viewport_url, page) for page in range(1, max_page + 1))
+
+                # Phase 2: pull the whole page pool through the bounded
+                # fetcher; bodies stream into the parse queue as they
+                # arrive, each bound to a preallocated slot
+                parsed = [None] * len(tasks)
+                parsed_batches.append(parsed)
+                await asyncio.gather(
+                    *(fetch_page(session, parsed, idx, viewport_url, page)
+                      for idx, (viewport_url, page) in enumerate(tasks))
+                )
+
+        # Wait for the parsers to drain whatever is still queued
+        await queue.join()
+
+        # Surface the first recorded parse failure, matching how the serial
+        # path would have raised
+        for parsed in parsed_batches:
+            for parts in parsed:
+                if isinstance(parts, Exception):
+                    raise parts
+    finally:
+        for consumer in consumers:
+            consumer.cancel()
+        pool.shutdown()
+
+    # Merge the parsed pages in task order now that the pipeline is drained
+    for parsed in parsed_batches:
+        for parts in parsed:
+            if parts is None:
+                continue
+            page_result, page_event, page_event_list, page_issue = parts
+            result.extend(page_result)
+            result_event.extend(page_event)
+            result_event_list.extend(page_event_list)
+            url_with_issue.extend(page_issue)
+
+    # Build the output tables in one shot from the accumulated rows
+    return (
+        pd.DataFrame(result, columns=list(RESULT_COLS)),
+        pd.DataFrame(result_event, columns=list(RESULT_EVENT_COLS)),
+        pd.DataFrame(result_event_list, columns=list(RESULT_EVENT_LIST_COLS)),
+        big_coord_boxes,
+        url_with_issue,
+    )
\ No newline at end of file